@@ -1,22 +1,105 @@
 #!/usr/bin/env python3
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+"""Static file server for the Godot web export, with COOP/COEP/CORS headers.
+
+Uses aiohttp so dozens of asset requests can be served in parallel during
+page load (the old single-threaded http.server blocked on Chrome keep-alive
+connections). Falls back to the stdlib ThreadingHTTPServer when aiohttp is
+not installed, which still serves connections concurrently.
+"""
+import asyncio
+import os
 import sys
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+CORS_HEADERS = {
+    'Cross-Origin-Opener-Policy': 'same-origin',
+    'Cross-Origin-Embedder-Policy': 'require-corp',
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
+    'Access-Control-Allow-Headers': '*',
+}
+
 
 class CORSRequestHandler(SimpleHTTPRequestHandler):
     def end_headers(self):
-        self.send_header('Cross-Origin-Opener-Policy', 'same-origin')
-        self.send_header('Cross-Origin-Embedder-Policy', 'require-corp')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', '*')
+        for name, value in CORS_HEADERS.items():
+            self.send_header(name, value)
         super().end_headers()
 
     def do_OPTIONS(self):
         self.send_response(200)
         self.end_headers()
 
-if __name__ == '__main__':
+    def copyfile(self, source, outputfile):
+        # sendfile(2) keeps the wasm/pck bytes in kernel space instead of
+        # copying them through a Python loop; fall back for non-regular files.
+        # The kernel may send fewer bytes than asked (its internal cap is
+        # well under a large .wasm/.pck), so loop until the file is done.
+        offset = 0
+        try:
+            in_fd = source.fileno()
+            out_fd = outputfile.fileno()
+            size = os.fstat(in_fd).st_size
+            while offset < size:
+                sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except (AttributeError, OSError, ValueError):
+            if offset:
+                # Part of the body is already on the wire; restarting with
+                # the userspace copy would corrupt the response.
+                raise
+            super().copyfile(source, outputfile)
+
+
+def serve_threaded(port):
+    """Stdlib fallback: one thread per connection, daemonized for clean Ctrl-C."""
+    ThreadingHTTPServer.daemon_threads = True
+    httpd = ThreadingHTTPServer(('', port), CORSRequestHandler)
+    httpd.serve_forever()
+
+
+def main():
     port = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
+
+    try:
+        from aiohttp import web
+    except ImportError:
+        print(f"Serving HTTP on port {port} with CORS enabled (threaded fallback)...")
+        serve_threaded(port)
+        return 0
+
+    # uvloop is optional but roughly doubles aiohttp throughput when present.
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+    async def on_response_prepare(request, response):
+        response.headers.update(CORS_HEADERS)
+
+    async def handle_options(request):
+        return web.Response(status=200)
+
+    async def handle_index(request):
+        return web.FileResponse('./index.html')
+
+    app = web.Application()
+    app.on_response_prepare.append(on_response_prepare)
+    app.router.add_route('OPTIONS', '/{tail:.*}', handle_options)
+    # add_static refuses directory requests with a 403, so the page the
+    # Godot export actually lands on is routed to index.html explicitly
+    # (matching SimpleHTTPRequestHandler's behaviour on the fallback path).
+    app.router.add_get('/', handle_index)
+    # web.static serves files via sendfile(2) where the platform supports it.
+    app.router.add_static('/', '.', follow_symlinks=False)
+
     print(f"Serving HTTP on port {port} with CORS enabled...")
-    httpd = HTTPServer(('', port), CORSRequestHandler)
-    httpd.serve_forever()
+    web.run_app(app, port=port)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
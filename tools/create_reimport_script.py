@@ -8,6 +8,50 @@ import os
 import json
 from pathlib import Path
 
+# Resolved once at import: the tools live in <project>/tools/, so the project
+# root is one level up. Keeps the scripts working wherever the repo is cloned.
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _enumerate_fbx_gdscript() -> str:
+    """GDScript block that builds the `fbx_files` array.
+
+    Shared by both generated editor scripts so the pack tree is only walked
+    once per editor session: the result is cached on Engine metadata, and
+    whichever generated script runs second reuses the cached list.
+    """
+    return """    var fbx_files = []
+    if Engine.has_meta("fbx_files"):
+        fbx_files = Engine.get_meta("fbx_files")
+    else:
+        var dir = DirAccess.open("res://assets/external/packs")
+        if dir:
+            dir.list_dir_begin()
+            var file_name = dir.get_next()
+            while file_name != "":
+                if file_name.ends_with(".fbx"):
+                    var full_path = "res://assets/external/packs/" + file_name
+                    fbx_files.append(full_path)
+                file_name = dir.get_next()
+            dir.list_dir_end()
+
+        # Also search subdirectories
+        for pack_dir in ["kenney_city-kit-suburban", "kenney_city-kit-industrial", "kenney_nature-kit", "kenney_city-kit-roads"]:
+            var pack_path = "res://assets/external/packs/" + pack_dir + "/Models/FBX format/"
+            if DirAccess.dir_exists_absolute(pack_path):
+                var dir2 = DirAccess.open(pack_path)
+                if dir2:
+                    dir2.list_dir_begin()
+                    var file_name = dir2.get_next()
+                    while file_name != "":
+                        if file_name.ends_with(".fbx"):
+                            var full_path = pack_path + file_name
+                            fbx_files.append(full_path)
+                        file_name = dir2.get_next()
+                    dir2.list_dir_end()
+        Engine.set_meta("fbx_files", fbx_files)
+"""
+
 
 def create_reimport_script():
     """Create a Godot script to reimport all external assets."""
@@ -17,42 +61,17 @@ extends EditorScript
 
 func _run():
     print("🔄 Reimporting all external assets after material enhancement...")
-    
+
     # Reimport all FBX files to extract materials with new settings
-    var fbx_files = []
-    var dir = DirAccess.open("res://assets/external/packs")
-    if dir:
-        dir.list_dir_begin()
-        var file_name = dir.get_next()
-        while file_name != "":
-            if file_name.ends_with(".fbx"):
-                var full_path = "res://assets/external/packs/" + file_name
-                fbx_files.append(full_path)
-            file_name = dir.get_next()
-        dir.list_dir_end()
-    
-    # Also search subdirectories
-    for pack_dir in ["kenney_city-kit-suburban", "kenney_city-kit-industrial", "kenney_nature-kit", "kenney_city-kit-roads"]:
-        var pack_path = "res://assets/external/packs/" + pack_dir + "/Models/FBX format/"
-        if DirAccess.dir_exists_absolute(pack_path):
-            var dir2 = DirAccess.open(pack_path)
-            if dir2:
-                dir2.list_dir_begin()
-                var file_name = dir2.get_next()
-                while file_name != "":
-                    if file_name.ends_with(".fbx"):
-                        var full_path = pack_path + file_name
-                        fbx_files.append(full_path)
-                    file_name = dir2.get_next()
-                dir2.list_dir_end()
-    
-    # Reimport all FBX files
+""" + _enumerate_fbx_gdscript() + """
+    # Reimport FBX files in batches — one dispatcher call per batch instead
+    # of one per file.
+    var batch_size = 100
     var reimported = 0
-    for fbx_path in fbx_files:
-        EditorInterface.get_resource_filesystem().reimport_files([fbx_path])
-        reimported += 1
-        if reimported % 10 == 0:
-            print("Reimported ", reimported, " files...")
+    for i in range(0, fbx_files.size(), batch_size):
+        var batch = fbx_files.slice(i, mini(i + batch_size, fbx_files.size()))
+        EditorInterface.get_resource_filesystem().reimport_files(batch)
+        reimported += batch.size()
     
     # Reimport texture files for good measure
     var texture_files = []
@@ -69,8 +88,9 @@ func _run():
                 file_name = dir3.get_next()
             dir3.list_dir_end()
     
-    for tex_path in texture_files:
-        EditorInterface.get_resource_filesystem().reimport_files([tex_path])
+    for i in range(0, texture_files.size(), batch_size):
+        var tex_batch = texture_files.slice(i, mini(i + batch_size, texture_files.size()))
+        EditorInterface.get_resource_filesystem().reimport_files(tex_batch)
     
     print("✅ Material enhancement complete!")
     print("   📦 Reimported ", reimported, " FBX files")
@@ -81,9 +101,17 @@ func _run():
     print("   All assets have optimized import settings")
 """
 
-    script_path = (
-        "/Users/cfaigle/Documents/Development/local/dogfight/tools/reimport_assets.gd"
-    )
+    script_path = os.fspath(PROJECT_ROOT / "tools" / "reimport_assets.gd")
+    # Skip the write when nothing changed — touching the file makes the Godot
+    # editor treat it as modified and kick off a pointless rescan.
+    try:
+        existing = Path(script_path).read_text()
+    except FileNotFoundError:
+        existing = None
+    if existing == reimport_script:
+        print(f"📝 Reimport script unchanged: {script_path}")
+        return
+
     with open(script_path, "w") as f:
         f.write(reimport_script)
 
@@ -4,39 +4,139 @@ Disable material extraction on FBX imports to prevent white square issues.
 This will force Godot to use embedded materials instead of broken extracted ones.
 """
 
+import json
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Resolved once at import: the tools live in <project>/tools/, so the project
+# root is one level up. Keeps the scripts working wherever the repo is cloned.
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+EXTERNAL_DIR = PROJECT_ROOT / "assets" / "external"
+
+# Both extract keys in one alternation so a file is scanned once instead of
+# the 'in' check plus replace passes.
+_EXTRACT_PAT = re.compile(rb"materials/extract(_format)?=1")
+
+# mtime cache so repeat runs skip files that were already patched (or verified
+# clean) on a prior run — steady-state re-runs become stat()-only.
+_CACHE_PATH = Path(__file__).parent / ".disable_extraction.cache.json"
+
+
+def _load_cache() -> dict:
+    try:
+        with open(_CACHE_PATH, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache: dict) -> None:
+    try:
+        with open(_CACHE_PATH, "w") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+
+def _iter_imports(root: str):
+    """Yield .fbx.import paths (as str) via os.scandir, no Path objects.
+
+    DirEntry carries the file type from the dirent, so the walk avoids the
+    per-entry stat and PurePath allocation that Path.rglob pays.
+    """
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_imports(entry.path)
+            elif entry.name.endswith(".fbx.import"):
+                yield entry.path
+
+
+def _patch_one(fbx_import: str):
+    """Disable material extraction in a single import file.
+
+    Returns (changed, message). Workers never touch stdout — per-file prints
+    flush the terminal per line and serialize the thread pool on the I/O lock.
+    """
+    name = os.path.basename(fbx_import)
+    try:
+        # Import files are ASCII; working on bytes skips Unicode decoding.
+        # Raw FDs also skip the BufferedReader/Writer wrappers — one read(2)
+        # is enough for these small manifests.
+        fd = os.open(fbx_import, os.O_RDONLY)
+        try:
+            content = os.read(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+
+        # Disable material extraction in a single linear scan.
+        content, n = _EXTRACT_PAT.subn(
+            lambda m: b"materials/extract" + (m.group(1) or b"") + b"=0", content
+        )
+        if n > 0:
+            # Write to a sibling temp file and rename so a crash mid-write can
+            # never leave a truncated .import behind.
+            tmp = fbx_import + ".tmp"
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, content)
+            finally:
+                os.close(fd)
+            os.replace(tmp, fbx_import)
+            return True, f"  ✅ Fixed: {name}"
+
+    except Exception as e:
+        return False, f"  ❌ Error: {name}: {e}"
+    return False, None
+
 
 def disable_material_extraction():
     """Set materials/extract=0 in all FBX import files."""
 
-    base_path = "/Users/cfaigle/Documents/Development/local/dogfight/assets/external"
-    fixed_files = 0
+    base_path = os.fspath(EXTERNAL_DIR)
 
     print("🔧 Disabling material extraction to fix white squares...")
 
-    # Find all FBX import files
-    for fbx_import in Path(base_path).rglob("*.fbx.import"):
+    cache = _load_cache()
+    pending = []
+    for fbx_import in _iter_imports(base_path):
         try:
-            with open(fbx_import, "r") as f:
-                content = f.read()
-
-            # Disable material extraction
-            if "materials/extract=1" in content:
-                content = re.sub(r"materials/extract=1", "materials/extract=0", content)
-                content = re.sub(
-                    r"materials/extract_format=1", "materials/extract_format=0", content
-                )
-
-                with open(fbx_import, "w") as f:
-                    f.write(content)
-                fixed_files += 1
-                print(f"  ✅ Fixed: {fbx_import.name}")
-
-        except Exception as e:
-            print(f"  ❌ Error: {fbx_import.name}: {e}")
+            st = os.stat(fbx_import)
+        except OSError:
+            continue
+        if cache.get(fbx_import) == st.st_mtime_ns:
+            continue
+        pending.append(fbx_import)
+
+    # The per-file work is pure I/O, so a thread pool gives near-linear speedup
+    # over the 545+ files despite the GIL.
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(_patch_one, pending))
+
+    fixed_files = sum(changed for changed, _ in results)
+    messages = [msg for _, msg in results if msg]
+    if messages:
+        print("\n".join(messages))
+
+    # Record post-write mtimes (patched and already-clean files alike) so the
+    # next run can skip them without reading. Failed files stay out of the
+    # cache — stamping them would silence the retry on every later run.
+    for fbx_import, (changed, msg) in zip(pending, results):
+        if not changed and msg is not None:
+            cache.pop(fbx_import, None)
+            continue
+        try:
+            cache[fbx_import] = os.stat(fbx_import).st_mtime_ns
+        except OSError:
+            cache.pop(fbx_import, None)
+    _save_cache(cache)
 
     print(f"✅ Disabled material extraction in {fixed_files} FBX import files")
     print(f"\n📋 This will use embedded materials instead of broken extracted ones")
@@ -45,41 +145,17 @@ def disable_material_extraction():
 def reimport_all():
     """Create a script to reimport all modified assets."""
 
+    from create_reimport_script import _enumerate_fbx_gdscript
+
     reimport_script = """@tool
 extends EditorScript
 
 func _run():
     print("🔄 Reimporting external assets after material extraction disabled...")
-    
-    var fbx_files = []
-    var dir = DirAccess.open("res://assets/external/packs")
-    if dir:
-        dir.list_dir_begin()
-        var file_name = dir.get_next()
-        while file_name != "":
-            if file_name.ends_with(".fbx"):
-                var full_path = "res://assets/external/packs/" + file_name
-                fbx_files.append(full_path)
-            file_name = dir.get_next()
-        dir.list_dir_end()
-    
-    # Also search subdirectories
-    for pack_dir in ["kenney_city-kit-suburban", "kenney_city-kit-industrial", "kenney_nature-kit", "kenney_city-kit-roads"]:
-        var pack_path = "res://assets/external/packs/" + pack_dir + "/Models/FBX format/"
-        if DirAccess.dir_exists_absolute(pack_path):
-            var dir2 = DirAccess.open(pack_path)
-            if dir2:
-                dir2.list_dir_begin()
-                var file_name = dir2.get_next()
-                while file_name != "":
-                    if file_name.ends_with(".fbx"):
-                        var full_path = pack_path + file_name
-                        fbx_files.append(full_path)
-                    file_name = dir2.get_next()
-                dir2.list_dir_end()
-    
+
+""" + _enumerate_fbx_gdscript() + """
     # Reimport all FBX files in smaller batches to avoid timeouts
-    var batch_size = 50
+    var batch_size = 100
     var reimported = 0
     
     for i in range(0, fbx_files.size(), batch_size):
@@ -98,7 +174,17 @@ func _run():
     print("Buildings will use embedded Kenney materials instead of broken extracted ones.")
 """
 
-    script_path = "/Users/cfaigle/Documents/Development/local/dogfight/tools/disable_extraction_reimport.gd"
+    script_path = os.fspath(PROJECT_ROOT / "tools" / "disable_extraction_reimport.gd")
+    # Skip the write when nothing changed — touching the file makes the Godot
+    # editor treat it as modified and kick off a pointless rescan.
+    try:
+        existing = Path(script_path).read_text()
+    except FileNotFoundError:
+        existing = None
+    if existing == reimport_script:
+        print(f"📝 Reimport script unchanged: {script_path}")
+        return
+
     with open(script_path, "w") as f:
         f.write(reimport_script)
 
@@ -4,104 +4,135 @@ Create proper .tres material files to fix the binary corruption issue.
 This creates valid Godot StandardMaterial3D resources with proper text format.
 """
 
+import functools
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-
-
-def create_proper_materials():
-    """Create proper .tres material files instead of broken binary ones."""
-
-    materials_dir = Path(
-        "/Users/cfaigle/Documents/Development/local/dogfight/materials/extracted"
-    )
-    external_packs_dir = Path(
-        "/Users/cfaigle/Documents/Development/local/dogfight/assets/external/packs"
-    )
-
-    print("🔧 Creating proper .tres material files...")
-
-    # Clean up broken binary files
-    print("  🗑️ Cleaning up corrupted binary files...")
-    for binary_file in materials_dir.glob("*_fixed.res"):
-        try:
-            binary_file.unlink()
-            print(f"    Removed: {binary_file.name}")
-        except:
-            pass
-
-    # Color definitions for different building materials
-    material_colors = {
-        "colormap": "Color(0.85, 0.75, 0.65)",  # Warm brown
-        "colorWhite": "Color(0.7, 0.7, 0.7)",  # Light gray instead of pure white
-        "colorRed": "Color(0.8, 0.2, 0.15)",  # Brick red
-        "colorTan": "Color(0.75, 0.6, 0.4)",  # Sandy tan
-        "colorYellow": "Color(0.9, 0.8, 0.2)",  # Sandy yellow
-        "corn": "Color(0.85, 0.75, 0.3)",  # Corn yellow
-        "dirt": "Color(0.6, 0.4, 0.2)",  # Dirt brown
-        "colorPurple": "Color(0.7, 0.4, 0.8)",  # Purple
-        "colorRedDark": "Color(0.6, 0.15, 0.1)",  # Dark red
-        "leafsDark": "Color(0.2, 0.4, 0.15)",  # Dark green leaves
-        "leafsFall": "Color(0.8, 0.6, 0.2)",  # Fall colors
-        "leafsGreen": "Color(0.3, 0.6, 0.2)",  # Fresh green leaves
-        "stoneDark": "Color(0.3, 0.3, 0.35)",  # Dark stone
-        "stone": "Color(0.5, 0.5, 0.55)",  # Medium stone
-        "wood": "Color(0.65, 0.4, 0.25)",  # Brown wood
-        "woodBarkDark": "Color(0.3, 0.2, 0.15)",  # Dark bark
-        "woodBirch": "Color(0.8, 0.7, 0.6)",  # Birch wood
-        "woodDark": "Color(0.4, 0.25, 0.15)",  # Dark wood
-        "woodInner": "Color(0.85, 0.75, 0.65)",  # Light wood
-        "grass": "Color(0.4, 0.7, 0.2)",  # Grass green
-        "glass": "Color(0.8, 0.9, 1.0)",  # Glass with transparency
-        "water": "Color(0.2, 0.6, 0.8)",  # Water blue
-    }
-
-    # Create proper .tres files
-    materials_created = 0
-    for mat_name, color in material_colors.items():
-        tres_content = f"""[gd_resource type="StandardMaterial3D" format=3 uid="uid://b{mat_name}"]
-
+from typing import Final
+
+# Resolved once at import: the tools live in <project>/tools/, so the project
+# root is one level up. Keeps the scripts working wherever the repo is cloned.
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+MATERIALS_DIR = PROJECT_ROOT / "materials" / "extracted"
+EXTERNAL_PACKS_DIR = PROJECT_ROOT / "assets" / "external" / "packs"
+
+# Invariant .tres layout, built once instead of re-assembling the literal on
+# every loop iteration. Header and body are kept separate so each file can be
+# written with one vectored writev(2).
+TRES_HEADER_TEMPLATE = (
+    '[gd_resource type="StandardMaterial3D" format=3 uid="uid://b{name}"]\n'
+)
+TRES_BODY_TEMPLATE = """
 [resource]
 albedo_color = {color}
 roughness = 0.9
 metallic = 0.0
 """
 
-        tres_file = materials_dir / f"{mat_name}.tres"
-        with open(tres_file, "w") as f:
-            f.write(tres_content)
-        materials_created += 1
-        print(f"    Created: {mat_name}.tres")
+# Color definitions for different building materials
+MATERIAL_COLORS: Final[dict[str, str]] = {
+    "colormap": "Color(0.85, 0.75, 0.65)",  # Warm brown
+    "colorWhite": "Color(0.7, 0.7, 0.7)",  # Light gray instead of pure white
+    "colorRed": "Color(0.8, 0.2, 0.15)",  # Brick red
+    "colorTan": "Color(0.75, 0.6, 0.4)",  # Sandy tan
+    "colorYellow": "Color(0.9, 0.8, 0.2)",  # Sandy yellow
+    "corn": "Color(0.85, 0.75, 0.3)",  # Corn yellow
+    "dirt": "Color(0.6, 0.4, 0.2)",  # Dirt brown
+    "colorPurple": "Color(0.7, 0.4, 0.8)",  # Purple
+    "colorRedDark": "Color(0.6, 0.15, 0.1)",  # Dark red
+    "leafsDark": "Color(0.2, 0.4, 0.15)",  # Dark green leaves
+    "leafsFall": "Color(0.8, 0.6, 0.2)",  # Fall colors
+    "leafsGreen": "Color(0.3, 0.6, 0.2)",  # Fresh green leaves
+    "stoneDark": "Color(0.3, 0.3, 0.35)",  # Dark stone
+    "stone": "Color(0.5, 0.5, 0.55)",  # Medium stone
+    "wood": "Color(0.65, 0.4, 0.25)",  # Brown wood
+    "woodBarkDark": "Color(0.3, 0.2, 0.15)",  # Dark bark
+    "woodBirch": "Color(0.8, 0.7, 0.6)",  # Birch wood
+    "woodDark": "Color(0.4, 0.25, 0.15)",  # Dark wood
+    "woodInner": "Color(0.85, 0.75, 0.65)",  # Light wood
+    "grass": "Color(0.4, 0.7, 0.2)",  # Grass green
+    "glass": "Color(0.8, 0.9, 1.0)",  # Glass with transparency
+    "water": "Color(0.2, 0.6, 0.8)",  # Water blue
+}
+
+
+# Deterministic creation order, computed once.
+MATERIAL_ITEMS: Final[list[tuple[str, str]]] = sorted(MATERIAL_COLORS.items())
+
+
+@functools.lru_cache(maxsize=None)
+def _render_tres(name: str, color: str) -> tuple[bytes, bytes]:
+    """Render header/body buffers; memoized so repeat invocations reuse them."""
+    return (
+        TRES_HEADER_TEMPLATE.format(name=name).encode(),
+        TRES_BODY_TEMPLATE.format(color=color).encode(),
+    )
 
-    # Create emergency fallback (light gray)
-    emergency_content = """[gd_resource type="StandardMaterial3D" format=3 uid="uid://bemergency_gray"]
 
-[resource]
-albedo_color = Color(0.6, 0.6, 0.6)
-roughness = 0.9
-metallic = 0.0
-"""
+def _writev_tres(path: Path, parts: tuple[bytes, bytes]) -> None:
+    """Write header+body in one vectored syscall instead of two writes."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.writev(fd, parts)
+    finally:
+        os.close(fd)
 
-    with open(materials_dir / "emergency_gray.tres", "w") as f:
-        f.write(emergency_content)
 
-    print(f"✅ Created {materials_created} proper .tres material files")
+def create_proper_materials():
+    """Create proper .tres material files instead of broken binary ones."""
 
+    materials_dir = MATERIALS_DIR
+    external_packs_dir = EXTERNAL_PACKS_DIR
 
-def remove_broken_extracted_materials():
-    """Remove broken materials/extracted directory to force fallback to proper materials."""
+    print("🔧 Creating proper .tres material files...")
 
-    materials_dir = Path(
-        "/Users/cfaigle/Documents/Development/local/dogfight/materials/extracted"
+    # Create proper .tres files, including the emergency fallback (light gray).
+    materials_dir.mkdir(parents=True, exist_ok=True)
+    items = [
+        (materials_dir / f"{mat_name}.tres", _render_tres(mat_name, color))
+        for mat_name, color in MATERIAL_ITEMS
+    ]
+    items.append(
+        (
+            materials_dir / "emergency_gray.tres",
+            _render_tres("emergency_gray", "Color(0.6, 0.6, 0.6)"),
+        )
     )
 
-    print("  🗑️ Removing broken materials/extracted directory...")
-    try:
-        if materials_dir.exists():
-            import shutil
+    # The writes are independent syscalls that release the GIL, so overlap
+    # them in a thread pool instead of paying each latency in sequence.
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(lambda pc: _writev_tres(pc[0], pc[1]), items))
+
+    # One buffered print instead of a line-buffered stdout flush per file.
+    print("\n".join(f"    Created: {path.name}" for path, _ in items[:-1]))
+    print(f"✅ Created {len(items) - 1} proper .tres material files")
+
+
+def remove_broken_extracted_materials():
+    """Remove broken extracted materials, keeping the proper .tres files we manage."""
+
+    materials_dir = MATERIALS_DIR
 
-            shutil.rmtree(materials_dir)
-            materials_dir.mkdir(parents=True, exist_ok=True)
-            print("    ✅ Removed broken extracted materials")
+    # Names we (re)generate and want to survive the cleanup.
+    keep_names = {f"{name}.tres" for name in MATERIAL_COLORS}
+    keep_names.add("emergency_gray.tres")
+
+    print("  🗑️ Removing broken extracted materials...")
+    try:
+        materials_dir.mkdir(parents=True, exist_ok=True)
+        # scandir's DirEntry carries the file type from the dirent, so no
+        # per-entry stat is needed to decide unlink vs rmtree.
+        with os.scandir(materials_dir) as entries:
+            for entry in entries:
+                if entry.name in keep_names:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+        print("    ✅ Removed broken extracted materials")
     except Exception as e:
         print(f"    ❌ Error removing extracted materials: {e}")
 
@@ -111,12 +142,13 @@ def main():
     print("🚨 Emergency White Square Fix")
     print("Creating proper .tres materials and removing broken extracted materials...")
 
+    # Remove broken extracted materials first so the cleanup cannot destroy
+    # the proper materials we are about to write.
+    remove_broken_extracted_materials()
+
     # Create proper materials
     create_proper_materials()
 
-    # Remove broken extracted materials directory
-    remove_broken_extracted_materials()
-
     print(f"\n✅ Emergency Fix Complete!")
     print(f"🎯 White Square Solution:")
     print(f"   ✅ Created proper .tres materials")
@@ -7,54 +7,90 @@ This script fixes the extracted materials to use correct texture paths or fallba
 import os
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Resolved once at import: the tools live in <project>/tools/, so the project
+# root is one level up. Keeps the scripts working wherever the repo is cloned.
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+MATERIALS_DIR = PROJECT_ROOT / "materials" / "extracted"
+EXTERNAL_PACKS_DIR = PROJECT_ROOT / "assets" / "external" / "packs"
+
+# Map of material names to fallback colors (avoid white). Module-level so
+# repeat calls don't rebuild the dict.
+FALLBACK_COLORS = {
+    "colormap": "res://assets/external/textures/ambientcg/Bricks079_2K-JPG/Bricks079_2K-JPG_Color.jpg",
+    "colorWhite": "Color(0.9, 0.9, 0.9)",  # Light gray instead of white
+    "colorRed": "Color(0.8, 0.2, 0.2)",  # Brick red
+    "colorTan": "Color(0.7, 0.6, 0.4)",  # Sandy tan
+    "colorYellow": "Color(0.9, 0.8, 0.2)",  # Sandy yellow
+    "corn": "Color(0.8, 0.6, 0.3)",  # Corn yellow
+    "dirt": "res://assets/external/textures/ambientcg/Dirt010_2K-JPG/Dirt010_2K-JPG_Color.jpg",
+    "colorPurple": "Color(0.6, 0.3, 0.8)",  # Purple
+    "colorRedDark": "Color(0.5, 0.1, 0.1)",  # Dark red
+}
+
+
+# Material bodies formatted from constants instead of re-evaluating a
+# triple-quoted f-string per loop iteration.
+_MAT_TMPL = (
+    '[gd_resource type="StandardMaterial3D" format=3 uid="uid://br{name}"]\n'
+    "\n"
+    "[resource]\n"
+    "albedo_color = {color}\n"
+    "roughness = 0.8\n"
+    "metallic = 0.0\n"
+)
+
+_DEBUG_TMPL = (
+    '[gd_resource type="StandardMaterial3D" format=3 uid="uid://bdebug_{name}"]\n'
+    "\n"
+    "[resource]\n"
+    "albedo_color = {color}\n"
+    "roughness = 0.9\n"
+    "metallic = 0.0\n"
+)
+
+_DEFAULT_COLOR = "Color(0.6, 0.6, 0.6)"
+
+
+def _iter_res_files(materials_dir):
+    """Yield the broken .res materials in one scandir pass.
+
+    glob() builds a Path per entry and re-reads the directory on every
+    caller; scandir reads it once and the 'fixed' filter runs on the plain
+    entry name.
+    """
+    try:
+        entries = os.scandir(materials_dir)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.name.endswith(".res") and "fixed" not in entry.name:
+                yield entry.name
+
 
 def fix_extracted_materials():
     """Fix extracted materials by either fixing texture paths or using fallback colors."""
 
-    materials_dir = Path(
-        "/Users/cfaigle/Documents/Development/local/dogfight/materials/extracted"
-    )
-    external_packs_dir = Path(
-        "/Users/cfaigle/Documents/Development/local/dogfight/assets/external/packs"
-    )
+    materials_dir = MATERIALS_DIR
 
     print("🔧 Fixing extracted materials to eliminate white squares...")
 
-    # Map of material names to fallback colors (avoid white)
-    fallback_colors = {
-        "colormap": "res://assets/external/textures/ambientcg/Bricks079_2K-JPG/Bricks079_2K-JPG_Color.jpg",
-        "colorWhite": "Color(0.9, 0.9, 0.9)",  # Light gray instead of white
-        "colorRed": "Color(0.8, 0.2, 0.2)",  # Brick red
-        "colorTan": "Color(0.7, 0.6, 0.4)",  # Sandy tan
-        "colorYellow": "Color(0.9, 0.8, 0.2)",  # Sandy yellow
-        "corn": "Color(0.8, 0.6, 0.3)",  # Corn yellow
-        "dirt": "res://assets/external/textures/ambientcg/Dirt010_2K-JPG/Dirt010_2K-JPG_Color.jpg",
-        "colorPurple": "Color(0.6, 0.3, 0.8)",  # Purple
-        "colorRedDark": "Color(0.5, 0.1, 0.1)",  # Dark red
-    }
-
     materials_fixed = 0
 
     # Find and fix .res material files (Godot binary materials)
-    for res_file in materials_dir.glob("*.res"):
+    for res_name in _iter_res_files(materials_dir):
         try:
-            # Skip if already fixed
-            if "fixed" in res_file.name:
-                continue
-
-            base_name = res_file.stem
+            base_name = res_name[: -len(".res")]
             print(f"  Fixing material: {base_name}")
 
             # Create a simple GDScript material instead of trying to fix binary
-            material_script = f"""[gd_resource type="StandardMaterial3D" format=3 uid="uid://br{base_name}"]
-
-[resource]
-albedo_color = {fallback_colors.get(base_name, "Color(0.6, 0.6, 0.6)")}
-roughness = 0.8
-metallic = 0.0
-"""
+            material_script = _MAT_TMPL.format(
+                name=base_name,
+                color=FALLBACK_COLORS.get(base_name, _DEFAULT_COLOR),
+            )
 
             # Write new material
             fixed_file = materials_dir / f"{base_name}_fixed.res"
@@ -64,7 +100,7 @@ metallic = 0.0
             materials_fixed += 1
 
         except Exception as e:
-            print(f"  ❌ Error fixing {res_file.name}: {e}")
+            print(f"  ❌ Error fixing {res_name}: {e}")
 
     print(f"✅ Fixed {materials_fixed} material files")
 
@@ -96,9 +132,7 @@ metallic = 0.0
 def create_debug_materials():
     """Create debug materials with solid colors to replace broken ones."""
 
-    materials_dir = Path(
-        "/Users/cfaigle/Documents/Development/local/dogfight/materials/extracted"
-    )
+    materials_dir = MATERIALS_DIR
 
     # Create solid colored materials as fallbacks
     colors = {
@@ -111,18 +145,19 @@ def create_debug_materials():
 
     print("🎨 Creating debug solid materials...")
 
-    for name, color in colors.items():
-        material_content = f"""[gd_resource type="StandardMaterial3D" format=3 uid="uid://bdebug_{name}"]
-
-[resource]
-albedo_color = {color}
-roughness = 0.9
-metallic = 0.0
-"""
+    # Pre-format every material, then overlap the writes: write_bytes is one
+    # write+close per file and the syscalls release the GIL, so a small pool
+    # hides the per-file latency instead of paying it five times in sequence.
+    items = [
+        (
+            materials_dir / f"debug_{name}.tres",
+            _DEBUG_TMPL.format(name=name, color=color).encode(),
+        )
+        for name, color in colors.items()
+    ]
 
-        material_file = materials_dir / f"debug_{name}.tres"
-        with open(material_file, "w") as f:
-            f.write(material_content)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda pc: pc[0].write_bytes(pc[1]), items))
 
     print(f"✅ Created {len(colors)} debug materials for testing")
 
@@ -133,10 +168,7 @@ def main():
     print("This fixes broken material texture paths causing white artifacts")
 
     # Create materials directory if it doesn't exist
-    materials_dir = Path(
-        "/Users/cfaigle/Documents/Development/local/dogfight/materials/extracted"
-    )
-    materials_dir.mkdir(parents=True, exist_ok=True)
+    MATERIALS_DIR.mkdir(parents=True, exist_ok=True)
 
     # Apply fixes
     fix_extracted_materials()
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""Run the material-fix tool scripts in one Python process.
+
+Invoking each script separately pays interpreter startup and module imports
+three times over; importing them here shares one interpreter and keeps the
+OS page cache warm for the assets/external tree between steps.
+
+Run:
+  python3 tools/run_all.py
+"""
+
+import create_reimport_script
+import disable_material_extraction
+import emergency_material_fix
+
+
+def main():
+    create_reimport_script.create_reimport_script()
+    disable_material_extraction.main()
+    emergency_material_fix.main()
+
+
+if __name__ == "__main__":
+    main()